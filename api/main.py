@@ -1,11 +1,17 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
-import hashlib
+from collections import OrderedDict
 import secrets
+import time
 
-app = FastAPI(title="VaultScribe API", version="0.1.0")
+app = FastAPI(
+    title="VaultScribe API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse
+)
 
 # Data models
 class SessionRequest(BaseModel):
@@ -20,31 +26,45 @@ class SessionResponse(BaseModel):
     matter_code: Optional[str]
 
 # In-memory storage for now (will use database later)
-sessions = {}
+# Bounded so a long-running worker can't grow without limit; oldest evicted first
+MAX_SESSIONS = 10_000
+sessions = OrderedDict()
+_now = datetime.now
+
+# Timestamp string reused for up to 1ms; fine wherever ms precision is enough
+_now_iso_cache = {"t": float("-inf"), "s": ""}
+
+def fast_now_iso():
+    t = time.monotonic()
+    c = _now_iso_cache
+    if t - c["t"] > 0.001:
+        c["s"] = _now().isoformat()
+        c["t"] = t
+    return c["s"]
+
+# Static parts of the root payload, pre-encoded once; only "time" changes per request
+_ROOT_STATIC = (b'{"name":"VaultScribe","status":"running","time":"', b'"}')
 
 @app.get("/")
-def root():
-    return {
-        "name": "VaultScribe", 
-        "status": "running",
-        "time": datetime.now().isoformat()
-    }
+async def root():
+    return Response(
+        _ROOT_STATIC[0] + fast_now_iso().encode() + _ROOT_STATIC[1],
+        media_type="application/json"
+    )
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "healthy"}
 
 @app.post("/api/session", response_model=SessionResponse)
-def create_session(request: SessionRequest):
+async def create_session(request: SessionRequest):
     # Generate unique session ID
-    session_id = hashlib.sha256(
-        f"{datetime.now().isoformat()}-{secrets.token_hex(8)}".encode()
-    ).hexdigest()[:16]
+    session_id = secrets.token_urlsafe(12)
     
     # Create session record
     session = {
         "session_id": session_id,
-        "created_at": datetime.now(),
+        "created_at": _now(),
         "matter_code": request.matter_code,
         "client_code": request.client_code,
         "description": request.description,
@@ -53,6 +73,8 @@ def create_session(request: SessionRequest):
     
     # Store in memory (temporary)
     sessions[session_id] = session
+    if len(sessions) > MAX_SESSIONS:
+        sessions.popitem(last=False)
     
     # TODO: Generate real presigned URL from S3/Azure
     upload_url = f"https://storage.vaultscribe.com/upload/{session_id}"
@@ -65,7 +87,8 @@ def create_session(request: SessionRequest):
     )
 
 @app.get("/api/session/{session_id}")
-def get_session(session_id: str):
-    if session_id not in sessions:
+async def get_session(session_id: str):
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    return sessions[session_id]
+    return session